@@ -181,7 +181,7 @@ install_with_spinner() {
 # Example usage for your dependency installation function
 install_dependencies() {
     log_info "Installing Python dependencies..."
-    local dependencies=("vllm" "python-dotenv" "toml" "openai" "triton==2.1.0" "wheel" "packaging" "psutil" "web3" "mnemonic" "prettytable")
+    local dependencies=("vllm" "python-dotenv" "toml" "openai" "triton==2.1.0" "wheel" "packaging" "psutil" "web3" "mnemonic" "prettytable" "nvidia-ml-py")
 
     for dep in "${dependencies[@]}"; do
         if ! install_with_spinner "$dep"; then
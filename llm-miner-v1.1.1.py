@@ -105,22 +105,21 @@ def generate(base_config, server_config, miner_id, job_id, prompt, temperature,
                     yield base_config.eos
             
             # Make a POST request to the server after initial data is received
-            with requests.Session() as session:
-                try:
-                    headers = {
-                        'job_id': str(job_id),
-                        'miner_id': str(miner_id),
-                        'Content-Type': 'text/event-stream'    
-                    }
-                    response = session.post(
-                        f"{base_config.base_url}/miner_submit_stream",
-                        headers=headers,
-                        data=generate_data(stream),
-                        stream=True
-                    )
+            try:
+                headers = {
+                    'job_id': str(job_id),
+                    'miner_id': str(miner_id),
+                    'Content-Type': 'text/event-stream'    
+                }
+                # The response body is read in full so its connection goes back to the session pool
+                with base_config.session.post(
+                    f"{base_config.base_url}/miner_submit_stream",
+                    headers=headers,
+                    data=generate_data(stream)
+                ) as response:
                     response.raise_for_status()
-                except requests.RequestException as e:
-                    logging.error(f"Failed to submit stream: {e}")
+            except requests.RequestException as e:
+                logging.error(f"Failed to submit stream: {e}")
 
         else:
             logging.info("Non-streaming mode")
@@ -170,6 +169,12 @@ def generate(base_config, server_config, miner_id, job_id, prompt, temperature,
         return
     
 def worker(miner_id):
+    def signal_handler(signum, frame):
+        # Exit normally when the parent terminates this worker so atexit flushes the log
+        sys.exit(0)
+
+    signal.signal(signal.SIGTERM, signal_handler)
+
     base_config, server_config = load_config()
     configure_logging(base_config, miner_id)
 
@@ -1,5 +1,5 @@
 from .config_utils import load_config, load_miner_ids
-from .cuda_utils import get_hardware_description
+from .cuda_utils import get_hardware_description, get_gpu_uuids
 from .decoder_utils import decode_prompt_llama, decode_prompt_mistral, decode_prompt_chatml
 from .requests_utils import send_miner_request
 from .requests_utils import get_metric_value
@@ -9,7 +9,7 @@ from .logging_utils import configure_logging
 
 __all__ = [
     'load_config', 'load_miner_ids',
-    'get_hardware_description',
+    'get_hardware_description', 'get_gpu_uuids',
     'decode_prompt_llama', 'decode_prompt_mistral', 'decode_prompt_chatml',
     'check_vllm_server_status', 'send_miner_request',
     'configure_logging',
@@ -1,8 +1,11 @@
 import os
 import re
 from pathlib import Path
-import subprocess
 from llm_mining_core.config import BaseConfig, LLMServerConfig
+from .cuda_utils import get_gpu_uuids
+
+MINER_ID_ENV_PATTERN = re.compile(r'MINER_ID_\d+')
+EVM_ADDRESS_PATTERN = re.compile(r"(0x[a-fA-F0-9]{40})(-[a-zA-Z0-9_]+)?")
 
 def load_config(filename='config.toml'):
     """
@@ -36,20 +39,21 @@ def load_miner_ids():
     Returns:
         list: A list of composite miner IDs extracted from the environment variables.
     """
-    pattern = re.compile(r'MINER_ID_\d+')
-    matching_env_vars = [var for var in os.environ if pattern.match(var)]
+    env = os.environ
+    matching_env_vars = [var for var in env if MINER_ID_ENV_PATTERN.match(var)]
     highest_index = max(int(var.split('_')[-1]) for var in matching_env_vars) if matching_env_vars else 0
-    miner_ids = [os.getenv(f'MINER_ID_{i}') for i in range(0, highest_index + 1)]
+    miner_ids = [env.get(f'MINER_ID_{i}') for i in range(0, highest_index + 1)]
     
     composite_miner_ids = []
-    evm_address_pattern = re.compile(r"^(0x[a-fA-F0-9]{40})(-[a-zA-Z0-9_]+)?$")
+    # GPU UUIDs are only looked up if some miner ID needs a suffix generated
+    gpu_uuids = None
 
     for i, miner_id in enumerate(miner_ids):
         if miner_id is None:
             print(f"ERROR: Miner ID for GPU {i} not found in environment variables. Skipping...")
             continue
         
-        match = evm_address_pattern.match(miner_id)
+        match = EVM_ADDRESS_PATTERN.fullmatch(miner_id)
         if match:
             evm_address = match.group(1)
             suffix = match.group(2)
@@ -59,16 +63,16 @@ def load_miner_ids():
                 composite_miner_ids.append(miner_id)
             else:
                 # Miner ID is a valid EVM address without a suffix or with an empty suffix
-                # Get the GPU UUID using nvidia-smi
-                try:
-                    output = subprocess.check_output(["nvidia-smi", "-L"]).decode("utf-8")
-                    gpu_info = output.split("\n")[i].strip()
-                    gpu_uuid_segment = gpu_info.split("GPU-")[1].split("-")[0]
+                # Use the GPU UUID queried from NVML
+                if gpu_uuids is None:
+                    gpu_uuids = get_gpu_uuids(len(miner_ids))
+                if gpu_uuids[i]:
+                    gpu_uuid_segment = gpu_uuids[i].split("GPU-", 1)[-1].split("-")[0]
                     short_uuid = gpu_uuid_segment[:6]
                     composite_miner_id = f"{evm_address}-{short_uuid}"
                     composite_miner_ids.append(composite_miner_id)
-                except (subprocess.CalledProcessError, IndexError):
-                    # nvidia-smi command failed or UUID not found
+                else:
+                    # NVML query failed or UUID not found
                     print(f"WARNING: Failed to retrieve GPU UUID for GPU {i}. Using original miner ID.")
                     composite_miner_ids.append(miner_id)
         else:
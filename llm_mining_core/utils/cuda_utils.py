@@ -13,4 +13,31 @@ def get_hardware_description():
     if torch.cuda.is_available():
         return torch.cuda.get_device_name(0)  # Assumes the first CUDA device if multiple are present
     else:
-        return "No CUDA devices found. Ensure you have a compatible NVIDIA GPU with the correct drivers installed."
\ No newline at end of file
+        return "No CUDA devices found. Ensure you have a compatible NVIDIA GPU with the correct drivers installed."
+
+
+def get_gpu_uuids(num_devices):
+    """
+    Returns the UUIDs of the first num_devices GPUs, queried in a single NVML session rather
+    than by running nvidia-smi once per GPU. Entries are None for GPUs whose UUID could not
+    be retrieved, and all entries are None if pynvml or NVML is unavailable.
+    """
+    gpu_uuids = [None] * num_devices
+    try:
+        from pynvml import nvmlInit, nvmlShutdown, nvmlDeviceGetHandleByIndex, nvmlDeviceGetUUID, NVMLError
+    except ImportError:
+        return gpu_uuids
+    try:
+        nvmlInit()
+    except NVMLError:
+        return gpu_uuids
+    try:
+        for i in range(num_devices):
+            try:
+                uuid = nvmlDeviceGetUUID(nvmlDeviceGetHandleByIndex(i))
+                gpu_uuids[i] = uuid.decode("utf-8") if isinstance(uuid, bytes) else uuid
+            except NVMLError:
+                pass
+    finally:
+        nvmlShutdown()
+    return gpu_uuids
@@ -1,5 +1,9 @@
 import re
 
+# Refined regular expression to match the role, im_start marker, content, and im_end marker
+# This pattern assumes that the role and content are concatenated without any separator
+CHATML_MESSAGE_PATTERN = re.compile(r"<|im_start|>(system|assistant|user)(.*?)<|im_end|>\n", re.DOTALL)
+
 def decode_prompt_llama(encoded_prompt):
     """
     Decodes and processes the encoded prompt for LLaMA models.
@@ -84,13 +88,9 @@ def decode_prompt_mistral(encoded_prompt):
     return messages
 
 def decode_prompt_chatml(encoded_prompt):
-    # Refined regular expression to match the role, im_start marker, content, and im_end marker
-    # This pattern assumes that the role and content are concatenated without any separator
-    pattern = re.compile(r"<|im_start|>(system|assistant|user)(.*?)<|im_end|>\n", re.DOTALL)
-
     messages = []
 
-    matches = pattern.finditer(encoded_prompt)
+    matches = CHATML_MESSAGE_PATTERN.finditer(encoded_prompt)
     for match in matches:
         role, content = match.groups()
         # Ensure that both role and content are not empty before adding to the list
@@ -1,4 +1,102 @@
+import time
+import queue
+import atexit
 import logging
+import logging.handlers
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+# Records are written to the log file in batches of this size, or after this many seconds
+LOG_BUFFER_CAPACITY = 256
+LOG_FLUSH_INTERVAL = 5
+
+# Background thread that owns the log file handler for this process, and the root
+# logger handler that feeds it
+_log_listener = None
+_queue_handler = None
+
+class _BufferedLogHandler(logging.handlers.MemoryHandler):
+    """
+    MemoryHandler that also flushes when a record arrives flush_interval seconds or more
+    after the last flush. Quiet periods are covered by _FlushingQueueListener.
+    """
+    def __init__(self, capacity, flush_interval, target):
+        super().__init__(capacity, flushLevel=logging.WARNING, target=target)
+        self.flush_interval = flush_interval
+        self.last_flush = time.monotonic()
+
+    def shouldFlush(self, record):
+        return super().shouldFlush(record) or time.monotonic() - self.last_flush >= self.flush_interval
+
+    def flush(self):
+        super().flush()
+        self.last_flush = time.monotonic()
+
+class _FlushingQueueListener(logging.handlers.QueueListener):
+    """
+    QueueListener that flushes its handlers whenever no record arrives for flush_interval
+    seconds, so buffered records reach the log file even while the miner is quiet.
+    """
+    def __init__(self, log_queue, *handlers, flush_interval, respect_handler_level=False):
+        super().__init__(log_queue, *handlers, respect_handler_level=respect_handler_level)
+        self.flush_interval = flush_interval
+
+    def dequeue(self, block):
+        if not block:
+            return self.queue.get(block)
+        while True:
+            try:
+                return self.queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                for handler in self.handlers:
+                    handler.flush()
+
+def _start_log_listener(log_filename, log_level):
+    """
+    Attach a QueueHandler to the root logger and write records to the log file in batches
+    from a background QueueListener thread, so callers never block on file I/O.
+    Does nothing if the root logger is already configured, mirroring logging.basicConfig.
+    """
+    global _log_listener, _queue_handler
+    root_logger = logging.getLogger()
+    if root_logger.handlers:
+        return
+
+    file_handler = logging.FileHandler(log_filename, mode='a')
+    file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    # Batch INFO records in memory; WARNING and above are written out immediately
+    buffered_handler = _BufferedLogHandler(LOG_BUFFER_CAPACITY, LOG_FLUSH_INTERVAL, file_handler)
+
+    log_queue = queue.Queue(-1)
+    _log_listener = _FlushingQueueListener(log_queue, buffered_handler, flush_interval=LOG_FLUSH_INTERVAL, respect_handler_level=True)
+    _log_listener.start()
+    atexit.register(flush_logging)
+
+    _queue_handler = logging.handlers.QueueHandler(log_queue)
+    root_logger.addHandler(_queue_handler)
+    root_logger.setLevel(log_level)
+
+def flush_logging():
+    """
+    Stop the background log listener and write any queued or buffered records to the log file.
+    Registered with atexit; signal handlers should call sys.exit() rather than this directly,
+    since stopping the listener takes the queue lock, which is not safe inside a signal handler.
+    """
+    global _log_listener, _queue_handler
+    if _log_listener is None:
+        return
+    listener, _log_listener = _log_listener, None
+
+    # Records logged from here on (e.g. by later atexit hooks) go straight to the log file
+    root_logger = logging.getLogger()
+    for handler in listener.handlers:
+        root_logger.addHandler(handler.target)
+    root_logger.removeHandler(_queue_handler)
+    _queue_handler = None
+
+    listener.stop()
+    for handler in listener.handlers:
+        handler.flush()
 
 def configure_logging(config, miner_id=None):
     """
@@ -8,6 +106,7 @@ def configure_logging(config, miner_id=None):
     and the miner ID. It constructs the log filename using the base log filename from
     the config and appends the miner ID if provided. The log file is opened in append
     mode, and the log messages are formatted with timestamp, name, level, and message.
+    Records are queued and written to the file by a background listener thread.
     The log level is set to INFO.
 
     Parameters:
@@ -29,9 +128,4 @@ def configure_logging(config, miner_id=None):
     # Verifying log level
 
     # Setup logging with the configured filename and log level
-    logging.basicConfig(
-        filename=process_log_filename,
-        filemode='a',
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        level=logging.INFO
-    )
\ No newline at end of file
+    _start_log_listener(process_log_filename, logging.INFO)
\ No newline at end of file
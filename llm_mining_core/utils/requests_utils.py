@@ -92,7 +92,7 @@ def get_metric_value(metric_name, base_config):
     try:
         url = f"{base_config.llm_url}:{base_config.port}/metrics"
         #Call the metrics endpoint to get the metric value
-        response = requests.get(url)
+        response = base_config.session.get(url)
         response_text = response.text
         lines = response_text.split('\n')
         for line in lines:
@@ -137,7 +137,7 @@ def send_model_info_signal(config, miner_id, last_signal_time):
 def post_request(config, url, data, miner_id=None):
     try:
         response = config.session.post(url, json=data)
-        logging.debug(f"Request sent to {url} with data {data} received response: {response.status_code}")
+        logging.debug("Request sent to %s with data %s received response: %s", url, data, response.status_code)
         # Directly return the response object
         return response
     except ValueError as ve:
@@ -3,10 +3,10 @@ import re
 import sys
 import time
 import torch
+import random
 import logging
 import signal
 import threading
-import subprocess
 from pathlib import Path
 from itertools import cycle
 from dotenv import load_dotenv
@@ -15,61 +15,72 @@ from auth.generator import WalletGenerator
 
 from sd_mining_core.base import BaseConfig, ModelUpdater
 from sd_mining_core.utils import (
-    check_cuda, get_hardware_description,
+    check_cuda, get_hardware_description, get_gpu_uuids,
     fetch_and_download_config_files, get_local_model_ids,
     post_request, log_response, submit_job_result,
     initialize_logging_and_args,
     load_default_model, reload_model,
 )
 
+# Idle backoff stops doubling after this many consecutive misses
+MAX_BACKOFF_EXPONENT = 10
+
 class MinerConfig(BaseConfig):
-    def __init__(self, config_file, cuda_device_id=0):
+    # A valid EVM address, optionally followed by a "-suffix"
+    EVM_ADDRESS_PATTERN = re.compile(r"(0x[a-fA-F0-9]{40})(?:-([a-zA-Z0-9_]+))?")
+
+    def __init__(self, config_file, cuda_device_id=0, miner_ids=None):
         super().__init__(config_file, cuda_device_id)
         if not self.skip_signature:
             self.wallet_generator = WalletGenerator(config_file, abi_file = os.path.join(os.path.dirname(__file__), 'auth', 'abi.json'))
         load_dotenv()  # Load the environment variables
         
-        miner_ids = self._load_and_validate_miner_ids()
+        # Child processes receive the miner IDs already validated by the parent process
+        if miner_ids is None:
+            miner_ids = self._load_and_validate_miner_ids()
+        self.miner_ids = miner_ids
         self.miner_id = self._assign_miner_id(miner_ids, cuda_device_id)
 
     def _load_and_validate_miner_ids(self):
-        miner_ids = [os.getenv(f'MINER_ID_{i}') for i in range(self.num_cuda_devices)]
+        env = os.environ
+        miner_ids = [env.get(f'MINER_ID_{i}') for i in range(self.num_cuda_devices)]
         if not self.skip_signature:
             self.wallet_generator.validate_miner_keys(miner_ids)
 
+        # GPU UUIDs are only looked up if some miner ID needs a suffix generated
+        gpu_uuids = None
         composite_miner_ids = []
-        evm_address_pattern = re.compile(r"^(0x[a-fA-F0-9]{40})(-[a-zA-Z0-9_]+)?$")
         for i, miner_id in enumerate(miner_ids):
             if miner_id is None:
                 print(f"ERROR: Miner ID for GPU {i} not found in .env. Exiting...")
                 raise ValueError(f"Miner ID for GPU {i} not found in .env.")
             
-            match = evm_address_pattern.match(miner_id)
-            if match:
-                evm_address = match.group(1)
-                suffix = match.group(2)
-                
-                if suffix:
-                    # Miner ID is a valid EVM address with a non-empty suffix
-                    composite_miner_ids.append(miner_id)
-                else:
-                    # Miner ID is a valid EVM address without a suffix or with an empty suffix
-                    # Get the GPU UUID using nvidia-smi
-                    try:
-                        output = subprocess.check_output(["nvidia-smi", "-L"]).decode("utf-8")
-                        gpu_info = output.split("\n")[i].strip()
-                        gpu_uuid_segment = gpu_info.split("GPU-")[1].split("-")[0]
-                        short_uuid = gpu_uuid_segment[:6]
-                        composite_miner_id = f"{evm_address}-{short_uuid}"
-                        composite_miner_ids.append(composite_miner_id)
-                    except (subprocess.CalledProcessError, IndexError):
-                        # nvidia-smi command failed or UUID not found
-                        print(f"WARNING: Failed to retrieve GPU UUID for GPU {i}. Using original miner ID.")
-                        composite_miner_ids.append(miner_id)
-            else:
+            match = self.EVM_ADDRESS_PATTERN.fullmatch(miner_id)
+            if not match:
                 # Miner ID is not a valid EVM address
                 print(f"WARNING: Miner ID {miner_id} for GPU {i} is not a valid EVM address.")
                 composite_miner_ids.append(miner_id)
+                continue
+
+            if match.group(2):
+                # Miner ID is a valid EVM address with a non-empty suffix
+                composite_miner_ids.append(miner_id)
+                continue
+
+            # Miner ID is a valid EVM address without a suffix or with an empty suffix
+            # Use the GPU UUID queried from NVML
+            if gpu_uuids is None:
+                gpu_uuids = get_gpu_uuids(self.num_cuda_devices)
+            if gpu_uuids[i]:
+                evm_address = match.group(1)
+                gpu_uuid_segment = gpu_uuids[i].split("GPU-", 1)[-1].split("-")[0]
+                short_uuid = gpu_uuid_segment[:6]
+                composite_miner_id = f"{evm_address}-{short_uuid}"
+                composite_miner_ids.append(composite_miner_id)
+            else:
+                # NVML query failed or UUID not found
+                print(f"WARNING: Failed to retrieve GPU UUID for GPU {i}. Using original miner ID.")
+                composite_miner_ids.append(miner_id)
         
         return composite_miner_ids
 
@@ -82,10 +93,10 @@ class MinerConfig(BaseConfig):
             print("ERROR: miner_id not found in .env. Exiting...")
             raise ValueError("miner_id not found in .env.")
 
-def load_config(filename='config.toml', cuda_device_id=0):
+def load_config(filename='config.toml', cuda_device_id=0, miner_ids=None):
     base_dir = os.path.dirname(os.path.abspath(__file__))
     config_path = os.path.join(base_dir, filename)
-    return MinerConfig(config_path, cuda_device_id)
+    return MinerConfig(config_path, cuda_device_id, miner_ids)
 
 def send_miner_request(config, model_id, min_deadline):
     request_data = {
@@ -93,11 +104,14 @@ def send_miner_request(config, model_id, min_deadline):
         "model_id": model_id,
         "min_deadline": min_deadline
     }
-    if time.time() - config.last_heartbeat >= 60:
+    current_time = time.time()
+    if current_time - config.last_heartbeat >= 60:
         request_data['hardware'] = get_hardware_description(config)
         request_data['version'] = config.version
-        config.last_heartbeat = time.time()
-        logging.debug(f"Heartbeat updated at {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(config.last_heartbeat))} with hardware '{request_data['hardware']}' and version {config.version} for miner ID {config.miner_id}.")
+        config.last_heartbeat = current_time
+        # Only format the heartbeat timestamp when debug logging is actually enabled
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug("Heartbeat updated at %s with hardware '%s' and version %s for miner ID %s.", time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(config.last_heartbeat)), request_data['hardware'], config.version, config.miner_id)
     
     start_time = time.time()
     response = post_request(config, config.base_url + "/miner_request", request_data, config.miner_id)
@@ -172,10 +186,15 @@ def process_jobs(config):
     submit_job_result(config, config.miner_id, job, job['temp_credentials'], job_start_time, request_latency)
     return True
 
-def main(cuda_device_id):
+def main(cuda_device_id, miner_ids=None):
+    def signal_handler(signum, frame):
+        # Exit normally when the parent terminates this worker so atexit flushes the log
+        sys.exit(0)
+
+    signal.signal(signal.SIGTERM, signal_handler)
 
     torch.cuda.set_device(cuda_device_id)
-    config = load_config(cuda_device_id=cuda_device_id)
+    config = load_config(cuda_device_id=cuda_device_id, miner_ids=miner_ids)
     config = initialize_logging_and_args(config, cuda_device_id, miner_id=config.miner_id)
 
     # The parent process should have already downloaded the model files
@@ -186,6 +205,7 @@ def main(cuda_device_id):
     load_default_model(config)
 
     last_signal_time = time.time()
+    miss_count = 0
     while True:
         try:
             last_signal_time = check_and_reload_model(config, last_signal_time)
@@ -193,8 +213,14 @@ def main(cuda_device_id):
         except Exception as e:
             logging.error("Error occurred:", exc_info=True)
             executed = False
-        if not executed:
-            time.sleep(config.sleep_duration)
+        if executed:
+            miss_count = 0
+        else:
+            # Back off exponentially while no jobs are received, with jitter so GPU processes don't poll in lockstep
+            backoff = min(config.sleep_duration * (2 ** miss_count), config.max_sleep_duration)
+            time.sleep(backoff + random.uniform(0, 0.5))
+            # Cap the exponent so it stays cheap even when sleep_duration is 0 and the cap is never reached
+            miss_count = min(miss_count + 1, MAX_BACKOFF_EXPONENT)
             
 if __name__ == "__main__":
     processes = []
@@ -229,7 +255,7 @@ if __name__ == "__main__":
     # Launch a separate process for each CUDA device
     try:
         for i in range(config.num_cuda_devices):
-            p = Process(target=main, args=(i,))
+            p = Process(target=main, args=(i, config.miner_ids))
             p.start()
             processes.append(p)
 
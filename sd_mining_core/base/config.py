@@ -34,6 +34,7 @@ class BaseConfig:
 
         self.min_deadline = int(self.config['system'].get('min_deadline', 60))
         self.sleep_duration = int(self.config['system'].get('sleep_duration', 2))
+        self.max_sleep_duration = int(self.config['system'].get('max_sleep_duration', 30))
         self.reload_interval = int(self.config['system'].get('reload_interval', 600))
 
         self.last_heartbeat = time.time() - 10000
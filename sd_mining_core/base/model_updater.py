@@ -21,8 +21,13 @@ class ModelUpdater:
     def calculate_model_checksum(self, file_path):
         sha256_hash = hashlib.sha256()
         with open(file_path, "rb") as f:
-            # Read and update hash string value in blocks of 4K
-            for byte_block in iter(lambda: f.read(4096), b""):
+            # Hint the kernel to read ahead aggressively, the whole file is read front to back
+            try:
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            except (AttributeError, OSError):
+                pass
+            # Read and update hash string value in blocks of 1M
+            for byte_block in iter(lambda: f.read(1024 * 1024), b""):
                 sha256_hash.update(byte_block)
         return sha256_hash.hexdigest()
     
@@ -1,11 +1,11 @@
-from .cuda_utils import check_cuda, get_hardware_description
+from .cuda_utils import check_cuda, get_hardware_description, get_gpu_uuids
 from .file_utils import download_file, fetch_and_download_config_files
 from .model_utils import get_local_model_ids, load_model, unload_model, load_default_model, reload_model, execute_model
 from .request_utils import post_request, log_response, submit_job_result
 from .logging_utils import configure_logging, initialize_logging_and_args
 
 __all__ = [
-    'check_cuda', 'get_hardware_description', 
+    'check_cuda', 'get_hardware_description', 'get_gpu_uuids',
     'download_file', 'fetch_and_download_config_files', 
     'get_local_model_ids', 'load_model', 'unload_model', 'load_default_model', 'reload_model','execute_model',
     'post_request', 'log_response', 'submit_job_result',
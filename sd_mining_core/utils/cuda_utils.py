@@ -20,4 +20,30 @@ def check_cuda():
     for i in range(num_devices):
         logging.info(f"Device {i}: {torch.cuda.get_device_name(i)}")
 
-    logging.info("CUDA is ready...")
\ No newline at end of file
+    logging.info("CUDA is ready...")
+
+def get_gpu_uuids(num_devices):
+    """
+    Returns the UUIDs of the first num_devices GPUs, queried in a single NVML session rather
+    than by running nvidia-smi once per GPU. Entries are None for GPUs whose UUID could not
+    be retrieved, and all entries are None if pynvml or NVML is unavailable.
+    """
+    gpu_uuids = [None] * num_devices
+    try:
+        from pynvml import nvmlInit, nvmlShutdown, nvmlDeviceGetHandleByIndex, nvmlDeviceGetUUID, NVMLError
+    except ImportError:
+        return gpu_uuids
+    try:
+        nvmlInit()
+    except NVMLError:
+        return gpu_uuids
+    try:
+        for i in range(num_devices):
+            try:
+                uuid = nvmlDeviceGetUUID(nvmlDeviceGetHandleByIndex(i))
+                gpu_uuids[i] = uuid.decode("utf-8") if isinstance(uuid, bytes) else uuid
+            except NVMLError:
+                pass
+    finally:
+        nvmlShutdown()
+    return gpu_uuids
@@ -8,7 +8,7 @@ from .model_utils import execute_model
 def post_request(config, url, data, miner_id=None):
     try:
         response = config.session.post(url, json=data)
-        logging.debug(f"Request sent to {url} with data {data} received response: {response.status_code}")
+        logging.debug("Request sent to %s with data %s received response: %s", url, data, response.status_code)
         # Directly return the response object
         return response
     except ValueError as ve:
@@ -81,7 +81,7 @@ def submit_job_result(config, miner_id, job, temp_credentials, job_start_time, r
         result["identity_address"] = identity_address
     try:
         start_time = time.time()  # Start measuring time for miner_submit call
-        response = requests.post(config.base_url + "/miner_submit", json=result)
+        response = config.session.post(config.base_url + "/miner_submit", json=result)
         response.raise_for_status()
         end_time = time.time()  # End measuring time
 